@@ -5,16 +5,91 @@ Complete examples for all major Fish Audio API functionalities
 
 import asyncio
 import httpx
+import mmap
 import ormsgpack
+import os
+import re
 import requests
 import subprocess
 import shutil
+import sys
 import websockets
-from typing import Literal, List, Optional, AsyncGenerator
-from pydantic import BaseModel
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager, suppress
+from itertools import islice
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import List, AsyncGenerator, Iterator
 from fish_audio_sdk import Session, WebSocketSession, TTSRequest, ASRRequest, ReferenceAudio
 from openai import AsyncOpenAI
 
+try:
+    import uvloop  # Optional: faster event loop for the WebSocket examples
+except ImportError:
+    uvloop = None
+
+try:
+    import h2  # noqa: F401  Optional: lets httpx speak HTTP/2 (pip install "httpx[http2]")
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+API_KEY = "YOUR_API_KEY"  # Get your key at: https://fish.audio/go-api/
+
+# Shared session so model/credit calls reuse pooled connections to api.fish.audio
+_SESSION = requests.Session()
+_SESSION.headers.update({"Authorization": f"Bearer {API_KEY}"})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# Shared TTS client with its headers bound once; HTTP/2 when h2 is installed
+_TTS_CLIENT = httpx.Client(
+    http2=HTTP2_AVAILABLE,
+    limits=httpx.Limits(max_keepalive_connections=10),
+    headers={
+        "authorization": f"Bearer {API_KEY}",
+        "content-type": "application/msgpack",
+        "model": "speech-1.6",  # Latest model
+    },
+    timeout=None,
+)
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+@contextmanager
+def map_file(path: str) -> Iterator[memoryview]:
+    """Memory-map a file read-only and yield a zero-copy view of its bytes"""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            view.release()  # mmap can't close while a view is exported
+
+REFERENCE_CACHE_SIZE = 50  # Reference files kept in memory
+
+# path -> (mtime_ns, size, audio), least recently used first
+_reference_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+def load_reference_audio(path: str) -> bytes:
+    """Read reference audio, cached until the file's mtime or size changes"""
+    stat = os.stat(path)
+    entry = _reference_cache.get(path)
+    if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+        _reference_cache.move_to_end(path)
+        return entry[2]
+    
+    # New or edited file: replace its entry rather than adding another copy
+    audio = Path(path).read_bytes()
+    _reference_cache[path] = (stat.st_mtime_ns, stat.st_size, audio)
+    _reference_cache.move_to_end(path)
+    if len(_reference_cache) > REFERENCE_CACHE_SIZE:
+        _reference_cache.popitem(last=False)
+    return audio
+
 
 # ============================================================================
 # 1. BASIC TEXT-TO-SPEECH
@@ -22,7 +97,7 @@ from openai import AsyncOpenAI
 
 def basic_tts_with_sdk():
     """Basic TTS using Fish Audio SDK"""
-    session = Session("your_api_key")
+    session = Session(API_KEY)
     
     # Option 1: Using a reference_id
     with open("output1.mp3", "wb") as f:
@@ -38,7 +113,7 @@ def basic_tts_with_sdk():
             text="Hello world!",
             references=[
                 ReferenceAudio(
-                    audio=open("reference.wav", "rb").read(),
+                    audio=load_reference_audio("reference.wav"),
                     text="Reference text for voice cloning"
                 )
             ]
@@ -50,48 +125,34 @@ def basic_tts_with_sdk():
 # 2. RAW API TTS WITH MSGPACK
 # ============================================================================
 
-class ServeReferenceAudio(BaseModel):
-    audio: bytes
-    text: str
-
-class ServeTTSRequest(BaseModel):
-    text: str
-    chunk_length: int = 200  # 100-300
-    format: Literal["wav", "pcm", "mp3"] = "mp3"
-    mp3_bitrate: Literal[64, 128, 192] = 128
-    references: List[ServeReferenceAudio] = []
-    reference_id: Optional[str] = None
-    normalize: bool = True
-    latency: Literal["normal", "balanced"] = "normal"
-
 def raw_api_tts():
     """TTS using raw API with MessagePack"""
-    request = ServeTTSRequest(
-        text="Hello from the raw API!",
-        format="mp3",
-        mp3_bitrate=128,
-        references=[
-            ServeReferenceAudio(
-                audio=open("reference.wav", "rb").read(),
-                text="Reference audio text"
-            )
+    # Plain dict: packed directly, no model or serializer options needed
+    request = {
+        "text": "Hello from the raw API!",
+        "chunk_length": 200,  # 100-300
+        "format": "mp3",  # "wav", "pcm" or "mp3"
+        "mp3_bitrate": 128,  # 64, 128 or 192
+        "references": [
+            {
+                "audio": load_reference_audio("reference.wav"),
+                "text": "Reference audio text",
+            }
         ],
-        latency="balanced"  # Lower latency mode
-    )
+        "reference_id": None,
+        "normalize": True,
+        "latency": "balanced",  # Lower latency mode ("normal" or "balanced")
+    }
+    content = ormsgpack.packb(request)
     
-    with httpx.Client() as client, open("raw_output.mp3", "wb") as f:
-        with client.stream(
+    with open("raw_output.mp3", "wb") as f:
+        with _TTS_CLIENT.stream(
             "POST",
             "https://api.fish.audio/v1/tts",
-            content=ormsgpack.packb(request, option=ormsgpack.OPT_SERIALIZE_PYDANTIC),
-            headers={
-                "authorization": "Bearer YOUR_API_KEY",
-                "content-type": "application/msgpack",
-                "model": "speech-1.6",  # Latest model
-            },
-            timeout=None
+            content=content,
         ) as response:
-            for chunk in response.iter_bytes():
+            # Large chunks pass straight through the file buffer to the fd
+            for chunk in response.iter_bytes(chunk_size=65536):
                 f.write(chunk)
 
 
@@ -101,14 +162,15 @@ def raw_api_tts():
 
 def streaming_tts():
     """Real-time streaming TTS with WebSocket"""
-    sync_websocket = WebSocketSession("your_api_key")
+    sync_websocket = WebSocketSession(API_KEY)
     
     def text_generator():
-        """Generate text in chunks"""
-        text = "This is a longer text that will be streamed word by word. " \
+        """Generate text in phrase-sized chunks"""
+        text = "This is a longer text that will be streamed phrase by phrase. " \
                "The Fish Audio API will generate speech in real-time as the text arrives."
-        for word in text.split():
-            yield word + " "  # Important: include space
+        # Split after punctuation; keep trailing whitespace so words don't merge
+        for match in re.finditer(r"[^.?!,;]+[.?!,;]*\s*|[.?!,;]+\s*", text):
+            yield match.group()
     
     tts_request = TTSRequest(
         text="",  # Start with empty text
@@ -134,87 +196,243 @@ def is_mpv_installed():
     """Check if MPV player is installed"""
     return shutil.which("mpv") is not None
 
-async def stream_audio(audio_stream: AsyncGenerator):
-    """Stream audio data using mpv player"""
+PIPE_WRITEV_MAX = 64  # Queued chunks handed to a single writev call
+
+class PipeWriter:
+    """Queue chunks for a non-blocking pipe and write them out with writev"""
+    
+    def __init__(self, fd: int):
+        os.set_blocking(fd, False)
+        self._fd = fd
+        self._loop = asyncio.get_running_loop()
+        self._pending = deque()
+        self._waiters = []
+        self._error = None
+    
+    def write(self, chunk: bytes):
+        if self._error:
+            raise self._error
+        if not self._pending:
+            # Wait for writability so chunks queued meanwhile share one syscall
+            self._loop.add_writer(self._fd, self._on_writable)
+        self._pending.append(memoryview(chunk))
+    
+    async def drain(self):
+        """Wait until every queued chunk has reached the pipe"""
+        if self._pending:
+            waiter = self._loop.create_future()
+            self._waiters.append(waiter)
+            await waiter
+        if self._error:
+            raise self._error
+    
+    def close(self):
+        """Stop watching the pipe and fail pending drains; call before closing the fd"""
+        self._loop.remove_writer(self._fd)
+        self._pending.clear()
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_exception(BrokenPipeError("pipe writer closed"))
+        self._waiters.clear()
+    
+    def _on_writable(self):
+        try:
+            written = os.writev(self._fd, list(islice(self._pending, PIPE_WRITEV_MAX)))
+        except BlockingIOError:
+            return
+        except OSError as e:  # e.g. mpv exited and closed its end
+            self._error = e
+            self._pending.clear()
+        else:
+            while written:
+                chunk = self._pending[0]
+                if written < len(chunk):
+                    self._pending[0] = chunk[written:]
+                    break
+                written -= len(chunk)
+                self._pending.popleft()
+        if not self._pending:
+            self._loop.remove_writer(self._fd)
+            for waiter in self._waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+            self._waiters.clear()
+
+def start_mpv() -> subprocess.Popen:
+    """Launch mpv reading audio from stdin"""
     if not is_mpv_installed():
         raise ValueError("MPV not found. Install with: brew install mpv (macOS) or apt-get install mpv (Linux)")
     
-    mpv_process = subprocess.Popen(
+    return subprocess.Popen(
         ["mpv", "--no-cache", "--no-terminal", "--", "fd://0"],
         stdin=subprocess.PIPE,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
     )
-    
-    async for chunk in audio_stream:
-        if chunk:
-            mpv_process.stdin.write(chunk)
-            mpv_process.stdin.flush()
-    
-    if mpv_process.stdin:
+
+async def play_audio(mpv_process: subprocess.Popen, audio_stream: AsyncGenerator):
+    """Pipe audio into a running mpv, then wait for it to finish playing"""
+    # Writes never block the event loop; pending frames go out together
+    writer = PipeWriter(mpv_process.stdin.fileno())
+    try:
+        async for chunk in audio_stream:
+            if chunk:
+                writer.write(chunk)
+        await writer.drain()
+    except BaseException:
+        mpv_process.terminate()  # Don't keep playing a failed or cancelled stream
+        raise
+    finally:
+        writer.close()  # Unregister before the fd number can be reused
         mpv_process.stdin.close()
-    mpv_process.wait()
+        await asyncio.to_thread(mpv_process.wait)
 
-async def websocket_tts_with_playback(text_iterator):
-    """Advanced WebSocket TTS with real-time playback"""
+async def stream_audio(audio_stream: AsyncGenerator):
+    """Stream audio data using mpv player"""
+    await play_audio(start_mpv(), audio_stream)
+
+UNPACK_OFFLOAD_SIZE = 1 << 20  # Frames larger than this are decoded in a thread
+
+# Constant control frames, packed once
+_FLUSH = ormsgpack.packb({"event": "flush"})
+_STOP = ormsgpack.packb({"event": "stop"})
+# Text envelope up to the text value (strip the packed empty string)
+_TEXT_PREFIX = ormsgpack.packb({"event": "text", "text": ""})[:-1]
+
+def pack_text_event(text: str) -> bytes:
+    """Pack a text event frame for the live TTS WebSocket"""
+    # Only the string is variable: write its msgpack str header by hand
+    data = text.encode()
+    size = len(data)
+    if size < 32:
+        header = bytes((0xA0 | size,))  # fixstr
+    elif size < 0x100:
+        header = b"\xd9" + size.to_bytes(1, "big")  # str8
+    elif size < 0x10000:
+        header = b"\xda" + size.to_bytes(2, "big")  # str16
+    else:
+        header = b"\xdb" + size.to_bytes(4, "big")  # str32
+    return _TEXT_PREFIX + header + data
+
+async def send_text(websocket, text_iterator):
+    """Send text as it arrives; text queued behind a send goes out as one frame"""
+    queue = asyncio.Queue()
+    
+    async def sender():
+        finished = False
+        while not finished:
+            parts = [await queue.get()]
+            # Merge whatever arrived while the previous send was in flight
+            while not queue.empty():
+                parts.append(queue.get_nowait())
+            if parts[-1] is None:
+                parts.pop()
+                finished = True
+            if parts:
+                await websocket.send(pack_text_event("".join(parts)))
+    
+    sender_task = asyncio.create_task(sender())
+    try:
+        async for text in text_iterator:
+            if text:
+                queue.put_nowait(text)
+            if sender_task.done():
+                break  # Surface the send error below
+        queue.put_nowait(None)
+        await sender_task
+    finally:
+        sender_task.cancel()
+
+async def listen_audio(websocket):
+    """Yield audio from a live TTS session until the server finishes it"""
+    # A clean close ends the loop; an abnormal close raises to the caller
+    async for message in websocket:
+        if len(message) > UNPACK_OFFLOAD_SIZE:
+            data = await asyncio.to_thread(ormsgpack.unpackb, message)
+        else:
+            data = ormsgpack.unpackb(message)
+        if data["event"] == "audio":
+            yield data["audio"]
+        elif data["event"] == "log":
+            print(f"Server log: {data['message']}")
+        elif data["event"] == "finish":
+            print(f"Session finished: {data['reason']}")
+            break
+
+@asynccontextmanager
+async def tts_playback_session():
+    """Live TTS session with playback that several texts can be spoken into
+    
+    Yields a WebSocket that has already sent the session's start event; pass
+    it to websocket_tts_with_playback to speak each text.
+    """
     uri = "wss://api.fish.audio/v1/tts/live"
     
-    async with websockets.connect(
-        uri, 
-        extra_headers={"Authorization": "Bearer YOUR_API_KEY"}
-    ) as websocket:
-        
-        # Send initial configuration
-        await websocket.send(ormsgpack.packb({
-            "event": "start",
-            "request": {
-                "text": "",
-                "latency": "balanced",
-                "format": "opus",
-                "temperature": 0.7,
-                "top_p": 0.7,
-                "prosody": {
-                    "speed": 1.0,  # 0.5-2.0
-                    "volume": 0    # dB adjustment
+    # Start mpv first so its startup overlaps the WebSocket handshake
+    mpv_process = start_mpv()
+    try:
+        async with websockets.connect(
+            uri, 
+            extra_headers={"Authorization": f"Bearer {API_KEY}"},
+            max_size=None,       # Audio frames can exceed the 1 MiB default
+            compression=None,    # Opus/msgpack payloads don't compress
+            read_limit=2**20,    # Larger buffers so each read pulls whole frames
+            write_limit=2**20,
+        ) as websocket:
+            # Send initial configuration once for the whole session
+            await websocket.send(ormsgpack.packb({
+                "event": "start",
+                "request": {
+                    "text": "",
+                    "latency": "balanced",
+                    "format": "opus",
+                    "temperature": 0.7,
+                    "top_p": 0.7,
+                    "prosody": {
+                        "speed": 1.0,  # 0.5-2.0
+                        "volume": 0    # dB adjustment
+                    },
+                    "reference_id": "MODEL_ID"
                 },
-                "reference_id": "MODEL_ID"
-            },
-            "debug": True
-        }))
-        
-        # Handle incoming audio
-        async def listen():
-            while True:
-                try:
-                    message = await websocket.recv()
-                    data = ormsgpack.unpackb(message)
-                    if data["event"] == "audio":
-                        yield data["audio"]
-                    elif data["event"] == "log":
-                        print(f"Server log: {data['message']}")
-                    elif data["event"] == "finish":
-                        print(f"Session finished: {data['reason']}")
-                        break
-                except websockets.exceptions.ConnectionClosed:
-                    break
-        
-        # Start audio streaming
-        listen_task = asyncio.create_task(stream_audio(listen()))
-        
-        # Stream text chunks
-        async for text in text_iterator:
-            if text:
-                await websocket.send(ormsgpack.packb({
-                    "event": "text", 
-                    "text": text
-                }))
-        
-        # Flush any remaining text
-        await websocket.send(ormsgpack.packb({"event": "flush"}))
-        
-        # End session
-        await websocket.send(ormsgpack.packb({"event": "stop"}))
-        await listen_task
+                "debug": True
+            }))
+            
+            # Play incoming audio for the lifetime of the session
+            listen_task = asyncio.create_task(play_audio(mpv_process, listen_audio(websocket)))
+            try:
+                yield websocket
+                
+                # End session and wait for the remaining audio
+                await websocket.send(_STOP)
+                await listen_task
+            finally:
+                # Let the player clean up before leaving; surfaces listener errors
+                listen_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await listen_task
+    finally:
+        # Covers a failed connect or a listener cancelled before it ran
+        if mpv_process.poll() is None:
+            mpv_process.terminate()
+            mpv_process.stdin.close()
+            await asyncio.to_thread(mpv_process.wait)
+
+async def websocket_tts_with_playback(text_iterator, websocket=None):
+    """Advanced WebSocket TTS with real-time playback
+    
+    ``websocket`` must be a started session from tts_playback_session(); a
+    bare connection has no start event and the server would ignore the text.
+    """
+    # Without a caller-owned session, run one just for this text
+    if websocket is None:
+        async with tts_playback_session() as websocket:
+            return await websocket_tts_with_playback(text_iterator, websocket)
+    
+    # Stream text chunks as they arrive
+    await send_text(websocket, text_iterator)
+    
+    # Flush any remaining text so this turn is spoken now
+    await websocket.send(_FLUSH)
 
 
 # ============================================================================
@@ -223,7 +441,7 @@ async def websocket_tts_with_playback(text_iterator):
 
 def speech_to_text_sdk():
     """Speech-to-Text using SDK"""
-    session = Session("your_api_key")
+    session = Session(API_KEY)
     
     with open("audio_to_transcribe.mp3", "rb") as f:
         audio_data = f.read()
@@ -245,36 +463,41 @@ def speech_to_text_sdk():
         ignore_timestamps=False
     ))
     
-    for segment in response.segments:
-        print(f"[{segment.start:.2f}s - {segment.end:.2f}s]: {segment.text}")
+    # One write for the whole transcript instead of a print per segment
+    sys.stdout.write("".join(
+        f"[{segment.start:.2f}s - {segment.end:.2f}s]: {segment.text}\n"
+        for segment in response.segments
+    ))
 
 def speech_to_text_raw_api():
     """Speech-to-Text using raw API"""
-    with open("audio.mp3", "rb") as f:
-        audio_data = f.read()
-    
-    request_data = {
-        "audio": audio_data,
-        "language": "en",
-        "ignore_timestamps": False
-    }
+    with map_file("audio.mp3") as audio_data:
+        request_data = {
+            "audio": audio_data,
+            "language": "en",
+            "ignore_timestamps": False
+        }
+        content = ormsgpack.packb(request_data)
     
     with httpx.Client() as client:
         response = client.post(
             "https://api.fish.audio/v1/asr",
             headers={
-                "Authorization": "Bearer YOUR_API_KEY",
+                "Authorization": f"Bearer {API_KEY}",
                 "Content-Type": "application/msgpack",
             },
-            content=ormsgpack.packb(request_data),
+            content=content,
         )
     
     result = response.json()
     print(f"Text: {result['text']}")
     print(f"Duration: {result['duration']}s")
     
-    for segment in result['segments']:
-        print(f"[{segment['start']}-{segment['end']}]: {segment['text']}")
+    # One write for the whole transcript instead of a print per segment
+    sys.stdout.write("".join(
+        f"[{segment['start']}-{segment['end']}]: {segment['text']}\n"
+        for segment in result['segments']
+    ))
 
 
 # ============================================================================
@@ -283,43 +506,43 @@ def speech_to_text_raw_api():
 
 def create_voice_model_sdk():
     """Create a voice model using SDK"""
-    session = Session("your_api_key")
-    
-    with open("voice1.mp3", "rb") as v1, \
-         open("voice2.wav", "rb") as v2, \
-         open("cover.jpg", "rb") as img:
-        
-        model = session.create_model(
-            title="My Custom Voice",
-            description="A custom voice model for TTS",
-            voices=[v1.read(), v2.read()],
-            cover_image=img.read()
-        )
+    session = Session(API_KEY)
+    
+    # Read the samples and cover image concurrently
+    paths = [Path("voice1.mp3"), Path("voice2.wav"), Path("cover.jpg")]
+    with ThreadPoolExecutor(len(paths)) as pool:
+        voice1, voice2, cover = pool.map(Path.read_bytes, paths)
+    
+    model = session.create_model(
+        title="My Custom Voice",
+        description="A custom voice model for TTS",
+        voices=[voice1, voice2],
+        cover_image=cover
+    )
     
     print(f"Created model: {model}")
     return model
 
 def create_voice_model_raw_api():
     """Create a voice model using raw API"""
-    response = requests.post(
-        "https://api.fish.audio/model",
-        files=[
-            ("voices", open("voice1.mp3", "rb")),
-            ("voices", open("voice2.wav", "rb")),
-        ],
-        data=[
-            ("visibility", "private"),
-            ("type", "tts"),
-            ("title", "My Voice Model"),
-            ("train_mode", "fast"),  # or "full" for better quality
-            ("enhance_audio_quality", "true"),
-            ("texts", "Text for voice 1"),
-            ("texts", "Text for voice 2"),
-        ],
-        headers={
-            "Authorization": "Bearer YOUR_API_KEY",
-        },
-    )
+    # Close the voice files once the upload is done
+    with open("voice1.mp3", "rb") as v1, open("voice2.wav", "rb") as v2:
+        response = _SESSION.post(
+            "https://api.fish.audio/model",
+            files=[
+                ("voices", v1),
+                ("voices", v2),
+            ],
+            data=[
+                ("visibility", "private"),
+                ("type", "tts"),
+                ("title", "My Voice Model"),
+                ("train_mode", "fast"),  # or "full" for better quality
+                ("enhance_audio_quality", "true"),
+                ("texts", "Text for voice 1"),
+                ("texts", "Text for voice 2"),
+            ],
+        )
     
     model = response.json()
     print(f"Created model ID: {model['_id']}")
@@ -332,7 +555,7 @@ def create_voice_model_raw_api():
 
 def tts_with_fine_control():
     """TTS with phoneme and paralanguage control"""
-    session = Session("your_api_key")
+    session = Session(API_KEY)
     
     # English with phoneme control
     text_phoneme = "I am an <|phoneme_start|>EH N JH AH N IH R<|phoneme_end|>."
@@ -359,14 +582,17 @@ def tts_with_fine_control():
 # 8. OPENAI INTEGRATION EXAMPLE
 # ============================================================================
 
-async def chat_with_tts():
+async def chat_with_tts(prompt: str = "Tell me a short joke", websocket=None, aclient=None):
     """Integrate OpenAI chat with Fish Audio TTS"""
-    aclient = AsyncOpenAI()
+    # Without a caller-owned client, use one just for this turn
+    if aclient is None:
+        async with AsyncOpenAI() as aclient:
+            return await chat_with_tts(prompt, websocket, aclient)
     
     # Get response from OpenAI
     response = await aclient.chat.completions.create(
         model="gpt-4o-mini",
-        messages=[{"role": "user", "content": "Tell me a short joke"}],
+        messages=[{"role": "user", "content": prompt}],
         stream=True,
     )
     
@@ -376,7 +602,14 @@ async def chat_with_tts():
                 yield chunk.choices[0].delta.content
     
     # Stream to TTS with playback
-    await websocket_tts_with_playback(text_iterator())
+    await websocket_tts_with_playback(text_iterator(), websocket)
+
+async def chat_loop_with_tts(prompts: List[str]):
+    """Run several chat turns through one OpenAI client and live TTS session"""
+    # Scoped to this loop: the client's connection pool belongs to this event loop
+    async with AsyncOpenAI() as aclient, tts_playback_session() as websocket:
+        for prompt in prompts:
+            await chat_with_tts(prompt, websocket, aclient)
 
 
 # ============================================================================
@@ -385,14 +618,13 @@ async def chat_with_tts():
 
 def list_models():
     """List available models"""
-    response = requests.get(
+    response = _SESSION.get(
         "https://api.fish.audio/model",
         params={
             "page_size": 10,
             "page_number": 1,
             "self": True  # Only your models
         },
-        headers={"Authorization": "Bearer YOUR_API_KEY"}
     )
     
     data = response.json()
@@ -403,17 +635,15 @@ def list_models():
 
 def get_model_details(model_id: str):
     """Get details of a specific model"""
-    response = requests.get(
+    response = _SESSION.get(
         f"https://api.fish.audio/model/{model_id}",
-        headers={"Authorization": "Bearer YOUR_API_KEY"}
     )
     return response.json()
 
 def delete_model(model_id: str):
     """Delete a model"""
-    response = requests.delete(
+    response = _SESSION.delete(
         f"https://api.fish.audio/model/{model_id}",
-        headers={"Authorization": "Bearer YOUR_API_KEY"}
     )
     return response.status_code == 200
 
@@ -424,9 +654,8 @@ def delete_model(model_id: str):
 
 def check_api_credits():
     """Check API credit balance"""
-    response = requests.get(
+    response = _SESSION.get(
         "https://api.fish.audio/wallet/self/api-credit",
-        headers={"Authorization": "Bearer YOUR_API_KEY"}
     )
     
     data = response.json()
@@ -440,12 +669,15 @@ def check_api_credits():
 # ============================================================================
 
 if __name__ == "__main__":
-    # Note: Replace YOUR_API_KEY with actual API key
+    # Note: Set API_KEY at the top of this file to your actual API key
     # Get your key at: https://fish.audio/go-api/
     
     print("Fish Audio API Examples")
     print("=======================")
     
+    # Run async examples on uvloop when it's installed
+    run = uvloop.run if uvloop else asyncio.run
+    
     # Example 1: Basic TTS
     # basic_tts_with_sdk()
     
@@ -471,7 +703,10 @@ if __name__ == "__main__":
     # list_models()
     
     # Example 9: Async TTS with OpenAI
-    # asyncio.run(chat_with_tts())
+    # run(chat_with_tts())
+    
+    # Example 10: Multi-turn chat over one TTS connection
+    # run(chat_loop_with_tts(["Tell me a short joke", "Another one"]))
     
     print("Examples ready to run!")
     print("Uncomment the examples you want to test.")
\ No newline at end of file